@@ -1,14 +1,105 @@
 """BigQuery connection and schema extraction functionality."""
 
+from google.api_core.exceptions import NotFound
 from google.cloud import bigquery
 import logging
 import os
+import re
 import json
-import random
-from genson import SchemaBuilder
+import time
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+
+from bq2md.schema import get_json_fields, parse_data_type, struct_field_paths
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    from google.cloud import bigquery_storage
+except ImportError:
+    bigquery_storage = None
 
 logger = logging.getLogger(__name__)
 
+# Seconds between status checks of running query jobs
+QUERY_POLL_INTERVAL = 0.5
+
+# Number of samples per JSON field included in the output
+MAX_DISPLAYED_SAMPLES = 3
+
+# Number of consecutive samples that must leave the inferred schema unchanged
+# before the remaining samples of a JSON field are skipped
+STABLE_SCHEMA_SAMPLES = 3
+
+def _parse_option_string(option_value):
+    """Unquote a string literal from INFORMATION_SCHEMA.TABLE_OPTIONS.
+
+    Args:
+        option_value (str): The quoted option value, e.g. ``"My table"``
+
+    Returns:
+        str: The unquoted value
+    """
+    if not option_value:
+        return ""
+    try:
+        return json.loads(option_value)
+    except json.JSONDecodeError:
+        return option_value.strip('"')
+
+def _format_timestamp_millis(millis):
+    """Format a ``__TABLES__`` timestamp as an ISO 8601 string.
+
+    Args:
+        millis (int): Milliseconds since the Unix epoch
+
+    Returns:
+        str: The UTC timestamp, or an empty string if there is none
+    """
+    if not millis:
+        return ""
+    return datetime.fromtimestamp(millis / 1000, tz=timezone.utc).isoformat()
+
+# orjson parses integers wider than 64 bits as floats, losing precision
+_LONG_DIGIT_RUN = re.compile(r"\d{19,}")
+
+def _json_loads(value):
+    """Parse a JSON string, with ``orjson`` when it is installed.
+
+    Strings containing a run of 19 or more digits may hold integers outside
+    the 64-bit range, so they are parsed with the standard library instead.
+
+    Args:
+        value (str): The JSON document
+
+    Returns:
+        The parsed JSON value
+    """
+    if orjson is not None and not _LONG_DIGIT_RUN.search(value):
+        return orjson.loads(value)
+    return json.loads(value)
+
+def _canonical_json(obj):
+    """Serialize a parsed JSON value with sorted keys, for comparing values.
+
+    Args:
+        obj: The parsed JSON value
+
+    Returns:
+        bytes | str: The canonical serialization
+    """
+    if orjson is not None:
+        try:
+            return orjson.dumps(obj, option=orjson.OPT_SORT_KEYS)
+        except TypeError:
+            # e.g. integers wider than 64 bits
+            pass
+    return json.dumps(obj, sort_keys=True)
+
 class BigQueryClient:
     """Client for interacting with BigQuery and extracting schema information."""
     
@@ -21,6 +112,8 @@ class BigQueryClient:
         # Use the provided project_id, or get from environment, or default to 'ateams'
         self.project_id = project_id or os.getenv("PROJECT_ID") or "ateams"
         self.client = bigquery.Client(project=self.project_id)
+        # Optional client for the Storage Read API, used to sample small tables
+        self.read_client = bigquery_storage.BigQueryReadClient() if bigquery_storage else None
         logger.info("BigQuery client initialized", {"project": self.project_id})
     
     def get_dataset_tables(self, dataset_id):
@@ -33,11 +126,139 @@ class BigQueryClient:
             list: List of table references
         """
         dataset_ref = self.client.dataset(dataset_id)
-        tables = list(self.client.list_tables(dataset_ref))
+        # The API defaults to 50 tables per page; request the maximum instead
+        tables = list(self.client.list_tables(dataset_ref, page_size=1000))
         
         logger.info("Retrieved tables from dataset", {"dataset": dataset_id, "table_count": len(tables)})
         return tables
     
+    def get_all_schemas(self, dataset_id):
+        """Get the schema for every table in a dataset with a single query.
+        
+        Column metadata comes from INFORMATION_SCHEMA and table metadata from
+        ``__TABLES__``, so the whole dataset costs one round-trip instead of one
+        ``get_table`` call per table. JSON fields are not sampled; use
+        ``add_json_samples`` for that.
+        
+        Args:
+            dataset_id (str): The BigQuery dataset ID
+            
+        Returns:
+            list: Table schema information dictionaries, ordered by table name
+        """
+        schemas = self._query_schemas(dataset_id)
+        logger.info("Retrieved schemas for dataset", {"dataset": dataset_id, "table_count": len(schemas)})
+        return schemas
+    
+    def _query_schemas(self, dataset_id, table_id=None):
+        """Query the schema of the tables in a dataset from INFORMATION_SCHEMA.
+        
+        Fields come from ``COLUMN_FIELD_PATHS``, which lists nested STRUCT
+        fields as well as top-level columns. Nested fields follow their parent
+        column in the order they are declared in its type, and are named by
+        their dotted path, e.g. ``address.city``.
+        INFORMATION_SCHEMA only records nullability for top-level columns, so
+        nested fields are reported as NULLABLE unless they are arrays.
+        
+        Args:
+            dataset_id (str): The BigQuery dataset ID
+            table_id (str, optional): Only query this table. Defaults to None.
+            
+        Returns:
+            list: Table schema information dictionaries, ordered by table name
+        """
+        dataset_path = f"{self.project_id}.{dataset_id}"
+        table_filter = "AND p.table_name = @table_id" if table_id else ""
+        query = f"""
+        SELECT
+            p.table_name,
+            p.column_name,
+            p.field_path,
+            p.data_type,
+            p.description,
+            c.is_nullable,
+            c.ordinal_position,
+            c.data_type AS column_data_type,
+            t.row_count,
+            t.creation_time,
+            t.last_modified_time,
+            o.option_value AS table_description
+        FROM `{dataset_path}.INFORMATION_SCHEMA.COLUMN_FIELD_PATHS` AS p
+        JOIN `{dataset_path}.INFORMATION_SCHEMA.COLUMNS` AS c
+            ON c.table_name = p.table_name AND c.column_name = p.column_name
+        JOIN `{dataset_path}.__TABLES__` AS t
+            ON t.table_id = p.table_name
+        LEFT JOIN `{dataset_path}.INFORMATION_SCHEMA.TABLE_OPTIONS` AS o
+            ON o.table_name = p.table_name AND o.option_name = 'description'
+        WHERE c.is_hidden = 'NO' {table_filter}
+        ORDER BY p.table_name, c.ordinal_position
+        """
+        job_config = None
+        if table_id:
+            job_config = bigquery.QueryJobConfig(
+                query_parameters=[bigquery.ScalarQueryParameter("table_id", "STRING", table_id)]
+            )
+        
+        rows = self.client.query(query, job_config=job_config).result()
+        
+        tables = {}
+        fields_by_table = defaultdict(list)
+        field_orders = {}
+        for row in rows:
+            if row.table_name not in tables:
+                tables[row.table_name] = {
+                    "name": row.table_name,
+                    "description": _parse_option_string(row.table_description),
+                    "num_rows": row.row_count or 0,
+                    "created": _format_timestamp_millis(row.creation_time),
+                    "modified": _format_timestamp_millis(row.last_modified_time),
+                }
+            
+            is_nullable = row.is_nullable if row.field_path == row.column_name else "YES"
+            field_type, mode = parse_data_type(row.data_type, is_nullable)
+            
+            # COLUMN_FIELD_PATHS rows come in no particular order, so nested
+            # fields are positioned by their declaration in the column's type
+            column_key = (row.table_name, row.column_name)
+            if column_key not in field_orders:
+                paths = [row.column_name] + list(struct_field_paths(row.column_name, row.column_data_type))
+                field_orders[column_key] = {path: position for position, path in enumerate(paths)}
+            position = field_orders[column_key].get(row.field_path, len(field_orders[column_key]))
+            
+            fields_by_table[row.table_name].append((row.ordinal_position, position, {
+                "name": row.field_path,
+                "type": field_type,
+                "mode": mode,
+                "description": row.description or ""
+            }))
+        
+        schemas = []
+        for table_name, schema_info in tables.items():
+            ordered_fields = sorted(fields_by_table[table_name], key=lambda item: item[:2])
+            schema_info["fields"] = [field for _, _, field in ordered_fields]
+            schemas.append(schema_info)
+        
+        return schemas
+    
+    def get_dataset_fingerprint(self, dataset_id):
+        """Get a value that changes whenever any table in a dataset changes.
+        
+        The fingerprint combines the table count, which catches deleted tables,
+        with the latest modification time of any table.
+        
+        Args:
+            dataset_id (str): The BigQuery dataset ID
+            
+        Returns:
+            str: The dataset fingerprint
+        """
+        query = f"""
+        SELECT COUNT(*) AS table_count, MAX(last_modified_time) AS last_modified
+        FROM `{self.project_id}.{dataset_id}.__TABLES__`
+        """
+        row = next(iter(self.client.query(query).result()))
+        return f"{row.table_count}:{row.last_modified}"
+    
     def get_table_schema(self, dataset_id, table_id):
         """Get the schema for a specific table.
         
@@ -48,47 +269,94 @@ class BigQueryClient:
         Returns:
             dict: Table schema information
         """
-        table_ref = self.client.dataset(dataset_id).table(table_id)
-        table = self.client.get_table(table_ref)
+        schemas = self._query_schemas(dataset_id, table_id)
+        if not schemas:
+            raise NotFound(f"Table {self.project_id}.{dataset_id}.{table_id} not found")
+        schema_info = schemas[0]
         
-        schema_info = {
-            "name": table.table_id,
-            "description": table.description or "",
-            "num_rows": table.num_rows,
-            "created": table.created.isoformat() if table.created else "",
-            "fields": []
-        }
+        self.add_json_samples(dataset_id, schema_info)
         
-        # Check for JSON fields to sample
-        json_fields = []
+        logger.info("Retrieved schema for table", {"dataset": dataset_id, "table": table_id})
+        return schema_info
+    
+    @staticmethod
+    def attach_json_samples(schema_info, json_samples):
+        """Attach sampled JSON schemas to the matching fields of a table.
         
-        for field in table.schema:
-            field_info = {
-                "name": field.name,
-                "type": field.field_type,
-                "mode": field.mode,
-                "description": field.description or ""
-            }
+        Args:
+            schema_info (dict): Table schema information, updated in place
+            json_samples (dict): Field names mapped to their JSON schema and samples
             
-            # Identify JSON fields for sampling
-            if field.field_type == "JSON":
-                json_fields.append(field.name)
-                
-            schema_info["fields"].append(field_info)
+        Returns:
+            dict: The updated table schema information
+        """
+        for field in schema_info["fields"]:
+            if field["name"] in json_samples:
+                field["json_schema"] = json_samples[field["name"]]["schema"]
+                field["json_samples"] = json_samples[field["name"]]["samples"]
         
-        # Sample JSON fields if any exist
-        if json_fields and table.num_rows > 0:
-            json_samples = self.sample_json_fields(dataset_id, table_id, json_fields)
+        return schema_info
+    
+    def add_json_samples(self, dataset_id, schema_info):
+        """Sample the JSON fields of a table and attach their inferred schema.
+        
+        Args:
+            dataset_id (str): The BigQuery dataset ID
+            schema_info (dict): Table schema information, updated in place
             
-            # Add JSON schema information to the fields
-            for field in schema_info["fields"]:
-                if field["name"] in json_samples:
-                    field["json_schema"] = json_samples[field["name"]]["schema"]
-                    field["json_samples"] = json_samples[field["name"]]["samples"]
+        Returns:
+            dict: The updated table schema information
+        """
+        json_fields = get_json_fields(schema_info)
+        
+        # Sample JSON fields if any exist
+        if json_fields:
+            json_samples = self.sample_json_fields(dataset_id, schema_info["name"], json_fields)
+            self.attach_json_samples(schema_info, json_samples)
         
-        logger.info("Retrieved schema for table", {"dataset": dataset_id, "table": table_id})
         return schema_info
     
+    def _json_sample_query(self, dataset_id, table_id, json_fields, select_list, sample_size, tablesample=True):
+        """Build the query that samples the JSON fields of a single table.
+        
+        By default BigQuery samples random storage blocks with ``TABLESAMPLE``,
+        so only about one percent of the JSON columns is read. Small tables can
+        have no block selected at all; for those, ``tablesample=False`` builds a
+        query that picks rows in a pseudo-random order instead. Rows are kept
+        when any of the JSON fields is set, so sparsely populated fields still
+        get samples. Callers select JSON fields through ``TO_JSON_STRING``, so
+        values arrive as JSON text instead of being decoded by the client
+        library, and are parsed by ``_json_loads``.
+        
+        Args:
+            dataset_id (str): The BigQuery dataset ID
+            table_id (str): The BigQuery table ID
+            json_fields (list): List of JSON field names to sample
+            select_list (str): The expressions to select
+            sample_size (int): Number of rows to return
+            tablesample (bool, optional): Whether to sample storage blocks. Defaults to True.
+            
+        Returns:
+            str: The sampling query
+        """
+        not_null_conditions = " OR ".join([f"`{field}` IS NOT NULL" for field in json_fields])
+        
+        if tablesample:
+            return f"""
+        SELECT {select_list}
+        FROM `{self.project_id}.{dataset_id}.{table_id}` TABLESAMPLE SYSTEM (1 PERCENT)
+        WHERE {not_null_conditions}
+        LIMIT {sample_size}
+        """
+        
+        return f"""
+        SELECT {select_list}
+        FROM `{self.project_id}.{dataset_id}.{table_id}`
+        WHERE {not_null_conditions}
+        ORDER BY FARM_FINGERPRINT(TO_JSON_STRING(STRUCT({", ".join(f"`{field}`" for field in json_fields)})))
+        LIMIT {sample_size}
+        """
+    
     def sample_json_fields(self, dataset_id, table_id, json_fields, sample_size=10):
         """Sample JSON fields from a table and infer their schema.
         
@@ -104,78 +372,334 @@ class BigQueryClient:
         if not json_fields:
             return {}
         
-        # Construct query to sample JSON fields
-        fields_str = ", ".join(json_fields)
-        query = f"""
-        SELECT {fields_str}
-        FROM `{self.project_id}.{dataset_id}.{table_id}`
-        WHERE {" AND ".join([f"{field} IS NOT NULL" for field in json_fields])}
-        LIMIT 100
-        """
+        select_list = ", ".join(f"TO_JSON_STRING(`{field}`) AS `{field}`" for field in json_fields)
         
         try:
-            # Execute query
-            query_job = self.client.query(query)
-            rows = list(query_job.result())
-            
+            # Execute query, falling back to reading the table if no block was sampled
+            query = self._json_sample_query(dataset_id, table_id, json_fields, select_list, sample_size)
+            rows = list(self.client.query(query).result())
             if not rows:
-                logger.warning("No samples found for JSON fields", {
-                    "dataset": dataset_id, 
-                    "table": table_id, 
-                    "fields": json_fields
-                })
-                return {}
-            
-            # Randomly select up to sample_size rows
-            if len(rows) > sample_size:
-                rows = random.sample(rows, sample_size)
-            
-            result = {}
-            
-            # Process each JSON field
-            for field in json_fields:
-                samples = []
-                schema_builder = SchemaBuilder()
-                
-                for row in rows:
-                    value = getattr(row, field)
-                    if value:
-                        try:
-                            # Parse JSON if it's a string
-                            if isinstance(value, str):
-                                parsed = json.loads(value)
-                            else:
-                                parsed = value
-                                
-                            # Add to schema builder
-                            schema_builder.add_object(parsed)
-                            
-                            # Add to samples
-                            samples.append(parsed)
-                        except (json.JSONDecodeError, TypeError) as e:
-                            logger.warning(f"Error parsing JSON for field {field}", {
-                                "error": str(e),
-                                "value": str(value)[:100] + "..." if len(str(value)) > 100 else str(value)
-                            })
-                
-                # Generate schema if we have samples
-                if samples:
-                    result[field] = {
-                        "schema": schema_builder.to_schema(),
-                        "samples": samples[:3]  # Limit to 3 samples in the output
-                    }
-            
-            logger.info("Sampled JSON fields", {
+                rows = self._read_json_rows(dataset_id, table_id, json_fields, sample_size) if self.read_client else None
+                if rows is None:
+                    query = self._json_sample_query(
+                        dataset_id, table_id, json_fields, select_list, sample_size, tablesample=False
+                    )
+                    rows = list(self.client.query(query).result())
+            return self._infer_json_schemas(dataset_id, table_id, json_fields, rows)
+            
+        except Exception as e:
+            logger.error("Error sampling JSON fields", {
                 "dataset": dataset_id, 
                 "table": table_id, 
-                "fields": list(result.keys())
+                "error": str(e)
             })
-            return result
+            return {}
+    
+    def sample_all_json_fields(self, dataset_id, fields_per_table, sample_size=10, max_workers=4, tables_per_query=50):
+        """Sample the JSON fields of many tables and infer their schema.
+        
+        Tables are sampled with one ``UNION ALL`` query per batch of
+        ``tables_per_query`` tables rather than one query per table, so the
+        query scheduling overhead is paid once per batch, and up to
+        ``max_workers`` batches run in parallel (see ``sample_json_fields_many``).
+        Each branch selects the union of all JSON field names as JSON text
+        (``NULL`` where a table lacks the field) plus a ``_tbl`` literal used to route the rows
+        back to their table. Column names are case-insensitive, so fields whose
+        names differ only in case share a column. When a batch query fails, its
+        tables are retried with one query each so that a single table that
+        cannot be sampled does not fail the others.
+        Tables for which ``TABLESAMPLE`` returned nothing are read through the
+        Storage Read API when it is installed, and otherwise sampled again in a
+        second round of batches without ``TABLESAMPLE``.
+        
+        Args:
+            dataset_id (str): The BigQuery dataset ID
+            fields_per_table (dict): Table IDs mapped to their JSON field names
+            sample_size (int, optional): Number of samples to take per table. Defaults to 10.
+            max_workers (int, optional): Maximum number of sampling jobs (batch queries or
+                Storage Read API table reads) running at once. Defaults to 4.
+            tables_per_query (int, optional): Number of tables per batch query. Defaults to 50.
+            
+        Returns:
+            dict: Table IDs mapped to dictionaries of field names to their JSON schema and samples;
+                tables whose sampling queries failed are omitted
+        """
+        fields_per_table = {table_id: fields for table_id, fields in fields_per_table.items() if fields}
+        if not fields_per_table:
+            return {}
+        
+        # The first spelling seen of each case-insensitive field name
+        column_names = {}
+        for fields in fields_per_table.values():
+            for field in fields:
+                column_names.setdefault(field.lower(), field)
+        column_names = sorted(column_names.items(), key=lambda item: item[1])
+        
+        def batch_query(batch, tablesample):
+            branches = []
+            for table_id in batch:
+                json_fields = fields_per_table[table_id]
+                table_fields = {field.lower(): field for field in json_fields}
+                select_list = ", ".join(
+                    [f"'{table_id}' AS _tbl"]
+                    + [
+                        f"TO_JSON_STRING(`{table_fields[key]}`) AS `{name}`" if key in table_fields
+                        else f"CAST(NULL AS STRING) AS `{name}`"
+                        for key, name in column_names
+                    ]
+                )
+                query = self._json_sample_query(dataset_id, table_id, json_fields, select_list, sample_size, tablesample)
+                branches.append(f"({query})")
+            return "\nUNION ALL\n".join(branches)
+        
+        def sample_tables(table_ids, tablesample):
+            batches = [table_ids[i:i + tables_per_query] for i in range(0, len(table_ids), tables_per_query)]
+            plans = [{"tables": batch, "query": batch_query(batch, tablesample)} for batch in batches]
+            rows_by_table = self.sample_json_fields_many(dataset_id, plans, max_in_flight=max_workers)
+            
+            # Retry the tables of failed batches one at a time
+            retry = [table_id for batch in batches if len(batch) > 1 for table_id in batch if table_id not in rows_by_table]
+            if retry:
+                logger.info("Retrying tables of failed batch queries individually", {
+                    "dataset": dataset_id,
+                    "table_count": len(retry)
+                })
+                plans = [{"tables": [table_id], "query": batch_query([table_id], tablesample)} for table_id in retry]
+                rows_by_table.update(self.sample_json_fields_many(dataset_id, plans, max_in_flight=max_workers))
+            return rows_by_table
+        
+        rows_by_table = {
+            table_id: rows
+            for table_id, rows in sample_tables(list(fields_per_table), tablesample=True).items()
+            if rows
+        }
+        unsampled = [table_id for table_id in fields_per_table if table_id not in rows_by_table]
+        
+        if unsampled and self.read_client:
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                read_rows = executor.map(
+                    lambda table_id: self._read_json_rows(dataset_id, table_id, fields_per_table[table_id], sample_size),
+                    unsampled
+                )
+                for table_id, rows in zip(unsampled, read_rows):
+                    if rows is not None:
+                        rows_by_table[table_id] = rows
+            unsampled = [table_id for table_id in unsampled if table_id not in rows_by_table]
+        
+        if unsampled:
+            rows_by_table.update(sample_tables(unsampled, tablesample=False))
+        
+        return {
+            table_id: self._infer_json_schemas(dataset_id, table_id, json_fields, rows_by_table[table_id])
+            for table_id, json_fields in fields_per_table.items()
+            if table_id in rows_by_table
+        }
+    
+    def sample_json_fields_many(self, dataset_id, plans, max_in_flight=4):
+        """Run several JSON sampling queries in parallel and group their rows by table.
+        
+        Jobs are submitted and polled from the calling thread. Up to
+        ``max_in_flight`` jobs run on BigQuery at once, and a new job is
+        submitted as soon as a running one finishes, so with enough slots the
+        total wait is that of the slowest job rather than the sum of all of
+        them. Each row must carry its table ID in a ``_tbl`` column.
+        
+        Args:
+            dataset_id (str): The BigQuery dataset ID
+            plans (list): Dictionaries with the ``query`` to run and the ``tables`` it samples
+            max_in_flight (int, optional): Maximum number of jobs running at once. Defaults to 4.
+            
+        Returns:
+            dict: Table IDs mapped to their sampled rows; tables whose query failed are omitted
+        """
+        results = [None] * len(plans)
+        pending = list(range(len(plans)))
+        running = {}
+        while pending or running:
+            # Fill the free slots with new jobs
+            while pending and len(running) < max_in_flight:
+                index = pending.pop(0)
+                try:
+                    running[index] = self.client.query(plans[index]["query"])
+                except Exception as e:
+                    results[index] = e
+            
+            finished = []
+            for index, query_job in running.items():
+                try:
+                    if query_job.done():
+                        results[index] = list(query_job.result())
+                        finished.append(index)
+                except Exception as e:
+                    results[index] = e
+                    finished.append(index)
+            for index in finished:
+                del running[index]
+            
+            if running and not finished:
+                time.sleep(QUERY_POLL_INTERVAL)
+        
+        rows_by_table = defaultdict(list)
+        for plan, result in zip(plans, results):
+            if isinstance(result, Exception):
+                logger.error("Error sampling JSON fields", {
+                    "dataset": dataset_id, 
+                    "tables": plan["tables"], 
+                    "error": str(result)
+                })
+                continue
+            # Every table of a successful query gets an entry, even without rows
+            for table_id in plan["tables"]:
+                rows_by_table.setdefault(table_id, [])
+            for row in result:
+                rows_by_table[row._tbl].append(row)
+        
+        return rows_by_table
+    
+    def _read_json_rows(self, dataset_id, table_id, json_fields, sample_size):
+        """Read sample rows of JSON fields through the BigQuery Storage Read API.
+        
+        Rows are streamed straight from table storage, so no query job is
+        scheduled. The first rows of a single stream are returned, which makes
+        this suited to small tables rather than random sampling of large ones.
+        
+        Args:
+            dataset_id (str): The BigQuery dataset ID
+            table_id (str): The BigQuery table ID
+            json_fields (list): List of JSON field names to sample
+            sample_size (int): Number of rows to return
+            
+        Returns:
+            list: Rows with one column per JSON field, or None if the table could not be read
+        """
+        types = bigquery_storage.types
+        requested_session = types.ReadSession(
+            table=f"projects/{self.project_id}/datasets/{dataset_id}/tables/{table_id}",
+            data_format=types.DataFormat.ARROW,
+            read_options=types.ReadSession.TableReadOptions(
+                selected_fields=json_fields,
+                row_restriction=" OR ".join([f"`{field}` IS NOT NULL" for field in json_fields])
+            )
+        )
+        
+        try:
+            session = self.read_client.create_read_session(
+                parent=f"projects/{self.project_id}",
+                read_session=requested_session,
+                max_stream_count=1
+            )
+            if not session.streams:
+                return []
+            
+            field_to_index = {field: index for index, field in enumerate(json_fields)}
+            rows = []
+            reader = self.read_client.read_rows(session.streams[0].name)
+            for page in reader.rows(session).pages:
+                batch = page.to_arrow()
+                columns = [batch.column(field).to_pylist() for field in json_fields]
+                rows.extend(bigquery.Row(values, field_to_index) for values in zip(*columns))
+                if len(rows) >= sample_size:
+                    break
+            return rows[:sample_size]
             
         except Exception as e:
-            logger.error("Error sampling JSON fields", {
+            logger.warning("Error reading JSON fields through the Storage Read API", {
                 "dataset": dataset_id, 
                 "table": table_id, 
                 "error": str(e)
             })
-            return {} 
\ No newline at end of file
+            return None
+    
+    def _infer_json_schemas(self, dataset_id, table_id, json_fields, rows):
+        """Infer the schema of JSON fields from sampled rows.
+        
+        Args:
+            dataset_id (str): The BigQuery dataset ID
+            table_id (str): The BigQuery table ID
+            json_fields (list): List of JSON field names to sample
+            rows (list): Sampled rows with one column per JSON field
+            
+        Returns:
+            dict: Dictionary mapping field names to their JSON schema and samples
+        """
+        from genson import SchemaBuilder
+        
+        if not rows:
+            logger.warning("No samples found for JSON fields", {
+                "dataset": dataset_id, 
+                "table": table_id, 
+                "fields": json_fields
+            })
+            return {}
+        
+        result = {}
+        
+        # Rows of one table share a layout, so resolve column positions once.
+        # Batched rows name the columns after another table's spelling of a
+        # field when the names differ only in case.
+        field_indices = {name.lower(): index for index, name in enumerate(rows[0].keys())}
+        
+        # Process each JSON field
+        for field in json_fields:
+            samples = []
+            schema_builder = SchemaBuilder()
+            schema = None
+            stable_count = 0
+            seen = set()
+            index = field_indices[field.lower()]
+            
+            for row in rows:
+                value = row[index]
+                if value:
+                    try:
+                        # Parse JSON if it's a string
+                        if isinstance(value, str):
+                            parsed = _json_loads(value)
+                        else:
+                            parsed = value
+                        # TO_JSON_STRING turns NULL into the text "null"
+                        if parsed is None:
+                            continue
+                        
+                        # Skip values identical to an earlier sample
+                        key = hash(_canonical_json(parsed))
+                        if key in seen:
+                            continue
+                        seen.add(key)
+                            
+                        # Add to schema builder
+                        schema_builder.add_object(parsed)
+                        
+                        # Add to samples
+                        if len(samples) < MAX_DISPLAYED_SAMPLES:
+                            samples.append(parsed)
+                        
+                        # Stop once the last few samples left the schema unchanged
+                        new_schema = schema_builder.to_schema()
+                        if new_schema == schema:
+                            stable_count += 1
+                            if stable_count >= STABLE_SCHEMA_SAMPLES:
+                                break
+                        else:
+                            schema = new_schema
+                            stable_count = 0
+                    except (json.JSONDecodeError, TypeError) as e:
+                        value_str = str(value)
+                        logger.warning(f"Error parsing JSON for field {field}", {
+                            "error": str(e),
+                            "value": value_str[:100] + "..." if len(value_str) > 100 else value_str
+                        })
+            
+            # Generate schema if we have samples
+            if samples:
+                result[field] = {
+                    "schema": schema,
+                    "samples": samples
+                }
+        
+        logger.info("Sampled JSON fields", {
+            "dataset": dataset_id, 
+            "table": table_id, 
+            "fields": list(result.keys())
+        })
+        return result
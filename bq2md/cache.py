@@ -0,0 +1,163 @@
+"""On-disk caching of extracted dataset schemas."""
+
+import os
+import json
+import logging
+import tempfile
+from pathlib import Path
+
+from bq2md.schema import get_json_fields
+
+logger = logging.getLogger(__name__)
+
+# Cache root, following the XDG base directory convention
+CACHE_DIR = Path(os.getenv("XDG_CACHE_HOME") or "~/.cache").expanduser() / "bq2md"
+
+# Version of the cache file layout; bump it whenever the schema information
+# dictionaries change so that older cache files are ignored
+CACHE_FORMAT_VERSION = 1
+
+# Keys every cached table and field must have, mapped to their types
+_TABLE_KEYS = {"name": str, "description": str, "num_rows": int, "created": str, "fields": list}
+_FIELD_KEYS = {"name": str, "type": str, "mode": str, "description": str}
+
+def get_cache_path(project_id, dataset_id):
+    """Get the path of the cache file for a dataset.
+    
+    Args:
+        project_id (str): The Google Cloud project ID
+        dataset_id (str): The BigQuery dataset ID
+        
+    Returns:
+        Path: Path to the cache file
+    """
+    return CACHE_DIR / project_id / f"{dataset_id}.json"
+
+def _has_keys(entry, keys):
+    """Check that a cached dictionary has the given keys with the given types.
+    
+    Args:
+        entry: The cached value
+        keys (dict): Required keys mapped to their types
+        
+    Returns:
+        bool: True if the entry is a dictionary with all the keys
+    """
+    return isinstance(entry, dict) and all(isinstance(entry.get(key), kind) for key, kind in keys.items())
+
+def _is_valid_schema(schema):
+    """Check that a cached table schema can be formatted and reused.
+    
+    Args:
+        schema: The cached table schema information
+        
+    Returns:
+        bool: True if the table and all of its fields have the required keys
+    """
+    return _has_keys(schema, _TABLE_KEYS) and all(_has_keys(field, _FIELD_KEYS) for field in schema["fields"])
+
+def load_cache(project_id, dataset_id):
+    """Load the cached schemas of a dataset.
+    
+    Args:
+        project_id (str): The Google Cloud project ID
+        dataset_id (str): The BigQuery dataset ID
+        
+    Returns:
+        dict: The cache entry with ``version``, ``fingerprint`` and ``schemas`` keys, or None if
+            there is none or it was written by another cache format version
+    """
+    cache_path = get_cache_path(project_id, dataset_id)
+    if not cache_path.exists():
+        return None
+    
+    try:
+        with open(cache_path, encoding="utf-8") as f:
+            cached = json.load(f)
+    except (OSError, json.JSONDecodeError) as e:
+        logger.warning("Ignoring unreadable cache file", {"path": str(cache_path), "error": str(e)})
+        return None
+    
+    if not isinstance(cached, dict) or cached.get("version") != CACHE_FORMAT_VERSION:
+        logger.info("Ignoring cache file from another version of bq2md", {"path": str(cache_path)})
+        return None
+    
+    if (
+        "fingerprint" not in cached
+        or not isinstance(cached.get("schemas"), list)
+        or not all(_is_valid_schema(schema) for schema in cached["schemas"])
+    ):
+        logger.warning("Ignoring malformed cache file", {"path": str(cache_path)})
+        return None
+    
+    return cached
+
+def save_cache(project_id, dataset_id, fingerprint, schemas):
+    """Save the schemas of a dataset to the cache.
+    
+    The file is written to a temporary path and moved into place, so an
+    interrupted run never leaves a truncated cache behind.
+    
+    Args:
+        project_id (str): The Google Cloud project ID
+        dataset_id (str): The BigQuery dataset ID
+        fingerprint (str): The dataset fingerprint the schemas were extracted at
+        schemas (list): List of schema information dictionaries
+        
+    Returns:
+        bool: True if successful, False otherwise
+    """
+    cache_path = get_cache_path(project_id, dataset_id)
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=cache_path.parent, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump({"version": CACHE_FORMAT_VERSION, "fingerprint": fingerprint, "schemas": schemas}, f, default=str)
+            os.replace(tmp_path, cache_path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+        logger.info("Saved schema cache", {"path": str(cache_path)})
+        return True
+    except Exception as e:
+        logger.warning("Failed to save schema cache", {"path": str(cache_path), "error": str(e)})
+        return False
+
+def reuse_json_samples(schemas, cached_schemas):
+    """Copy sampled JSON schemas from cached tables that have not changed.
+    
+    A table is unchanged when its ``modified`` timestamp matches the cached
+    one. If every JSON field of the cached table has a sampled schema, those
+    are copied to the matching fields and the table does not need to be
+    sampled again; otherwise it is sampled afresh.
+    
+    Args:
+        schemas (list): Freshly extracted schema information dictionaries, updated in place
+        cached_schemas (list): Schema information dictionaries from the cache
+        
+    Returns:
+        set: Names of the tables whose JSON samples were reused
+    """
+    cached_by_name = {schema["name"]: schema for schema in cached_schemas}
+    reused = set()
+    
+    for schema in schemas:
+        cached = cached_by_name.get(schema["name"])
+        if not cached or not schema.get("modified") or cached.get("modified") != schema["modified"]:
+            continue
+        
+        cached_fields = {field["name"]: field for field in cached["fields"]}
+        if any("json_schema" not in cached_fields[name] for name in get_json_fields(cached)):
+            continue
+        
+        for field in schema["fields"]:
+            cached_field = cached_fields.get(field["name"])
+            if cached_field and "json_schema" in cached_field:
+                field["json_schema"] = cached_field["json_schema"]
+                field["json_samples"] = cached_field.get("json_samples", [])
+        reused.add(schema["name"])
+    
+    if reused:
+        logger.info("Reused cached JSON samples", {"table_count": len(reused)})
+    return reused
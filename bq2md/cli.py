@@ -6,8 +6,8 @@ import logging
 from pathlib import Path
 
 from bq2md.config import check_credentials
-from bq2md.bigquery import BigQueryClient
-from bq2md.formatter import MarkdownFormatter
+from bq2md.cache import load_cache, save_cache, reuse_json_samples
+from bq2md.schema import get_json_fields
 
 # Configure logging
 logging.basicConfig(
@@ -16,17 +16,71 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+def extract_schemas(bq_client, dataset, workers, cached_schemas=None):
+    """Extract the schema of every table in a dataset, sampling JSON fields.
+    
+    Args:
+        bq_client (BigQueryClient): The BigQuery client
+        dataset (str): The BigQuery dataset ID
+        workers (int): Maximum number of JSON sampling jobs running at once
+        cached_schemas (list, optional): Schemas from a previous run, whose JSON
+            samples are reused for unchanged tables. Defaults to None.
+        
+    Returns:
+        tuple: List of schema information dictionaries, and the names of the
+            tables whose JSON sampling failed
+    """
+    # Get the schema of every table in the dataset
+    schemas = bq_client.get_all_schemas(dataset)
+    if schemas:
+        click.echo(f"Found {len(schemas)} tables in dataset '{dataset}'")
+    
+    # Tables unchanged since the previous run keep their cached JSON samples
+    reused = reuse_json_samples(schemas, cached_schemas) if cached_schemas else set()
+    
+    # Sample the JSON fields of all other tables in batched queries
+    fields_per_table = {}
+    for schema in schemas:
+        if schema["name"] in reused:
+            continue
+        json_fields = get_json_fields(schema)
+        if json_fields:
+            fields_per_table[schema["name"]] = json_fields
+    
+    if fields_per_table:
+        click.echo(f"Sampling JSON fields from {len(fields_per_table)} tables...")
+        json_samples = bq_client.sample_all_json_fields(dataset, fields_per_table, max_workers=workers)
+        for schema in schemas:
+            bq_client.attach_json_samples(schema, json_samples.get(schema["name"], {}))
+        failed_tables = [table_id for table_id in fields_per_table if table_id not in json_samples]
+    else:
+        failed_tables = []
+    
+    return schemas, failed_tables
+
 @click.command()
 @click.option(
     "--dataset",
     required=True,
     help="BigQuery dataset ID to extract schema from"
 )
+@click.option(
+    "--workers",
+    default=4,
+    show_default=True,
+    type=click.IntRange(min=1),
+    help="Maximum number of JSON sampling jobs (queries or Storage Read API reads) running at once"
+)
+@click.option(
+    "--no-cache",
+    is_flag=True,
+    help="Ignore and do not update the on-disk schema cache"
+)
 @click.argument(
     "output_file",
     type=click.Path(dir_okay=False)
 )
-def main(dataset, output_file):
+def main(dataset, workers, no_cache, output_file):
     """Extract BigQuery table schemas and save as Markdown.
     
     OUTPUT_FILE is the path where the Markdown file will be saved.
@@ -39,34 +93,47 @@ def main(dataset, output_file):
         click.echo("Please set the GOOGLE_APPLICATION_CREDENTIALS environment variable.", err=True)
         sys.exit(1)
     
+    # Imported here so that --help and credential errors do not pay for
+    # loading the Google Cloud client libraries
+    from bq2md.bigquery import BigQueryClient
+    from bq2md.formatter import MarkdownFormatter
+    
     try:
         # Initialize BigQuery client
         bq_client = BigQueryClient()
         
-        # Get tables in dataset
-        tables = bq_client.get_dataset_tables(dataset)
+        # Reuse the cached schemas if no table changed since the last run
+        cached = None
+        if not no_cache:
+            fingerprint = bq_client.get_dataset_fingerprint(dataset)
+            cached = load_cache(bq_client.project_id, dataset)
         
-        if not tables:
+        if cached and cached["fingerprint"] == fingerprint:
+            schemas = cached["schemas"]
+            click.echo(f"Dataset '{dataset}' unchanged since last run, using cached schemas")
+        else:
+            schemas, failed_tables = extract_schemas(bq_client, dataset, workers, cached["schemas"] if cached else None)
+            # A cached partial result would never be retried, so only cache complete runs
+            if failed_tables:
+                logger.warning("Not caching schemas after failed JSON sampling", {
+                    "dataset": dataset,
+                    "tables": failed_tables
+                })
+                click.echo(f"Warning: JSON sampling failed for {len(failed_tables)} tables; results were not cached", err=True)
+            elif not no_cache:
+                save_cache(bq_client.project_id, dataset, fingerprint, schemas)
+        
+        if not schemas:
             logger.warning("No tables found in dataset", {"dataset": dataset})
             click.echo(f"Warning: No tables found in dataset '{dataset}'")
             sys.exit(0)
         
-        click.echo(f"Found {len(tables)} tables in dataset '{dataset}'")
-        
-        # Extract schema for each table
-        schemas = []
-        with click.progressbar(tables, label="Extracting schemas") as progress_tables:
-            for table in progress_tables:
-                schema = bq_client.get_table_schema(dataset, table.table_id)
-                schemas.append(schema)
-        
-        # Format schemas as markdown
+        # Format schemas as markdown and save to file
         click.echo("Formatting as Markdown...")
-        markdown_content = MarkdownFormatter.format_dataset_schemas(dataset, schemas)
-        
-        # Save to file
         output_path = Path(output_file)
-        MarkdownFormatter.save_markdown(markdown_content, output_path)
+        if not MarkdownFormatter.write_dataset_schemas(dataset, schemas, output_path):
+            click.echo(f"Error: Failed to save schema to {output_path}", err=True)
+            sys.exit(1)
         
         click.echo(f"Successfully saved schema to {output_path}")
         logger.info("Command completed successfully", {"dataset": dataset, "output": str(output_path)})
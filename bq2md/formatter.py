@@ -4,123 +4,181 @@ import logging
 import json
 from pathlib import Path
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 logger = logging.getLogger(__name__)
 
+def _dumps_indented(obj):
+    """Serialize an object as JSON indented by two spaces.
+    
+    Uses ``orjson`` when it is installed and can encode the object, otherwise
+    the standard library.
+    
+    Args:
+        obj: The object to serialize
+        
+    Returns:
+        str: The JSON document
+    """
+    if orjson is not None:
+        try:
+            return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode()
+        except TypeError:
+            # e.g. integers wider than 64 bits
+            pass
+    return json.dumps(obj, indent=2)
+
 class MarkdownFormatter:
     """Format BigQuery schema information as Markdown."""
     
     @staticmethod
-    def format_table_schema(schema_info):
-        """Format a single table schema as Markdown.
+    def iter_table_schema_lines(schema_info):
+        """Generate the Markdown for a single table schema, section by section.
         
         Args:
             schema_info (dict): Table schema information
             
-        Returns:
-            str: Markdown formatted schema
+        Yields:
+            str: Markdown sections, without trailing newlines
         """
-        md_lines = []
-        
-        # Table header
-        md_lines.append(f"# Table: {schema_info['name']}")
-        md_lines.append("")
-        
-        # Table description
-        if schema_info['description']:
-            md_lines.append(schema_info['description'])
-            md_lines.append("")
+        dumps = _dumps_indented
+        fields = schema_info['fields']
         
-        # Table metadata
-        md_lines.append(f"**Rows**: {schema_info['num_rows']:,}")
-        if schema_info['created']:
-            md_lines.append(f"**Created**: {schema_info['created']}")
-        md_lines.append("")
-        
-        # Fields header
-        md_lines.append("## Schema")
-        md_lines.append("")
-        md_lines.append("| Field | Type | Mode | Description |")
-        md_lines.append("|-------|------|------|-------------|")
+        # Table header, description and metadata, followed by the fields header
+        description = f"{schema_info['description']}\n\n" if schema_info['description'] else ""
+        created = f"**Created**: {schema_info['created']}\n" if schema_info['created'] else ""
+        yield f"""# Table: {schema_info['name']}
+
+{description}**Rows**: {schema_info['num_rows']:,}
+{created}
+## Schema
+
+| Field | Type | Mode | Description |
+|-------|------|------|-------------|"""
         
         # Fields
-        json_fields = []
-        for field in schema_info['fields']:
-            name = field['name']
-            field_type = field['type']
-            mode = field['mode']
-            description = field['description'].replace("\n", " ")
-            
-            md_lines.append(f"| {name} | {field_type} | {mode} | {description} |")
-            
-            # Track JSON fields for detailed display later
-            if field_type == "JSON" and "json_schema" in field:
-                json_fields.append(field)
-        
-        md_lines.append("")
+        if fields:
+            yield "\n".join(
+                f"| {f['name']} | {f['type']} | {f['mode']} | {f['description'].replace(chr(10), ' ')} |"
+                for f in fields
+            )
+        yield ""
         
         # Add detailed JSON field information if available
-        for field in json_fields:
-            md_lines.append(f"### JSON Field: {field['name']}")
-            md_lines.append("")
+        for field in fields:
+            if field['type'] != "JSON" or "json_schema" not in field:
+                continue
             
-            # Add JSON schema
-            md_lines.append("#### Schema")
-            md_lines.append("```json")
-            md_lines.append(json.dumps(field['json_schema'], indent=2))
-            md_lines.append("```")
-            md_lines.append("")
+            yield f"""### JSON Field: {field['name']}
+
+#### Schema
+```json
+{dumps(field['json_schema'])}
+```
+"""
             
             # Add sample values
-            if "json_samples" in field and field["json_samples"]:
-                md_lines.append("#### Sample Values")
+            if field.get("json_samples"):
+                yield "#### Sample Values"
                 for i, sample in enumerate(field["json_samples"], 1):
-                    md_lines.append(f"**Sample {i}:**")
-                    md_lines.append("```json")
-                    md_lines.append(json.dumps(sample, indent=2))
-                    md_lines.append("```")
-                    md_lines.append("")
+                    yield f"""**Sample {i}:**
+```json
+{dumps(sample)}
+```
+"""
+    
+    @staticmethod
+    def format_table_schema(schema_info):
+        """Format a single table schema as Markdown.
         
-        return "\n".join(md_lines)
+        Args:
+            schema_info (dict): Table schema information
+            
+        Returns:
+            str: Markdown formatted schema
+        """
+        return "\n".join(MarkdownFormatter.iter_table_schema_lines(schema_info))
     
     @staticmethod
-    def format_dataset_schemas(dataset_id, schemas):
-        """Format all schemas in a dataset as a single Markdown document.
+    def iter_dataset_lines(dataset_id, schemas):
+        """Generate the Markdown for all schemas in a dataset.
         
         Args:
             dataset_id (str): The BigQuery dataset ID
             schemas (list): List of schema information dictionaries
             
-        Returns:
-            str: Markdown formatted schemas
+        Yields:
+            str: Markdown lines or sections, without trailing newlines
         """
-        md_lines = []
-        
         # Dataset header
-        md_lines.append(f"# Dataset: {dataset_id}")
-        md_lines.append("")
-        md_lines.append(f"This document contains the schema information for {len(schemas)} tables in the `{dataset_id}` dataset.")
-        md_lines.append("")
+        yield f"# Dataset: {dataset_id}"
+        yield ""
+        yield f"This document contains the schema information for {len(schemas)} tables in the `{dataset_id}` dataset."
+        yield ""
+        
+        # Anchors are shared by the table of contents and the table sections
+        anchors = [schema['name'].lower() for schema in schemas]
         
         # Table of contents
-        md_lines.append("## Tables")
-        md_lines.append("")
+        yield "## Tables"
+        yield ""
         
-        for schema in schemas:
-            md_lines.append(f"- [{schema['name']}](#{schema['name'].lower()})")
+        if schemas:
+            yield "\n".join(
+                f"- [{schema['name']}](#{anchor})" for schema, anchor in zip(schemas, anchors)
+            )
         
-        md_lines.append("")
-        md_lines.append("---")
-        md_lines.append("")
+        yield ""
+        yield "---"
+        yield ""
         
         # Add each table schema
-        for schema in schemas:
-            table_md = MarkdownFormatter.format_table_schema(schema)
-            md_lines.append(f"<a id='{schema['name'].lower()}'></a>")
-            md_lines.append(table_md)
-            md_lines.append("---")
-            md_lines.append("")
-        
-        return "\n".join(md_lines)
+        for schema, anchor in zip(schemas, anchors):
+            yield f"<a id='{anchor}'></a>"
+            yield from MarkdownFormatter.iter_table_schema_lines(schema)
+            yield "---"
+            yield ""
+    
+    @staticmethod
+    def format_dataset_schemas(dataset_id, schemas):
+        """Format all schemas in a dataset as a single Markdown document.
+        
+        Args:
+            dataset_id (str): The BigQuery dataset ID
+            schemas (list): List of schema information dictionaries
+            
+        Returns:
+            str: Markdown formatted schemas
+        """
+        return "\n".join(MarkdownFormatter.iter_dataset_lines(dataset_id, schemas))
+    
+    @staticmethod
+    def write_dataset_schemas(dataset_id, schemas, output_path):
+        """Stream all schemas in a dataset to a Markdown file.
+        
+        Lines are written as they are generated, so only one table's output is
+        held in memory at a time rather than the whole document.
+        
+        Args:
+            dataset_id (str): The BigQuery dataset ID
+            schemas (list): List of schema information dictionaries
+            output_path (str): Path to save the markdown file
+            
+        Returns:
+            bool: True if successful, False otherwise
+        """
+        try:
+            output_file = Path(output_path)
+            with open(output_file, "w", encoding="utf-8", buffering=1 << 20) as f:
+                f.writelines(line + "\n" for line in MarkdownFormatter.iter_dataset_lines(dataset_id, schemas))
+            logger.info("Saved markdown file", {"path": str(output_file)})
+            return True
+        except Exception as e:
+            logger.error("Failed to save markdown file", {"path": str(output_path), "error": str(e)})
+            return False
     
     @staticmethod
     def save_markdown(markdown_content, output_path):
@@ -135,7 +193,8 @@ class MarkdownFormatter:
         """
         try:
             output_file = Path(output_path)
-            output_file.write_text(markdown_content)
+            with open(output_file, "w", encoding="utf-8", buffering=1 << 20) as f:
+                f.write(markdown_content)
             logger.info("Saved markdown file", {"path": str(output_file)})
             return True
         except Exception as e:
@@ -0,0 +1,97 @@
+"""Helpers for table schema information dictionaries."""
+
+import re
+
+# INFORMATION_SCHEMA reports GoogleSQL type names, while the REST API (and
+# therefore the rest of bq2md) uses the legacy names.
+_LEGACY_TYPE_NAMES = {
+    "INT64": "INTEGER",
+    "FLOAT64": "FLOAT",
+    "BOOL": "BOOLEAN",
+    "STRUCT": "RECORD",
+}
+
+def parse_data_type(data_type, is_nullable):
+    """Convert an INFORMATION_SCHEMA data type into a field type and mode.
+
+    Args:
+        data_type (str): GoogleSQL type, e.g. ``ARRAY<STRUCT<a INT64>>`` or ``STRING(10)``
+        is_nullable (str): The ``is_nullable`` column value (``YES`` or ``NO``)
+
+    Returns:
+        tuple: The legacy field type name and the field mode
+    """
+    mode = "NULLABLE" if is_nullable == "YES" else "REQUIRED"
+    if data_type.startswith("ARRAY<"):
+        mode = "REPEATED"
+        data_type = data_type[len("ARRAY<"):-1]
+
+    base_type = re.match(r"\w+", data_type).group(0)
+    return _LEGACY_TYPE_NAMES.get(base_type, base_type), mode
+
+def split_type_members(type_body):
+    """Split the members of a STRUCT type on its top-level commas.
+
+    Args:
+        type_body (str): The text between ``STRUCT<`` and the closing ``>``
+
+    Returns:
+        list: The member declarations, e.g. ``a INT64``
+    """
+    members = []
+    depth = 0
+    start = 0
+    for index, char in enumerate(type_body):
+        if char in "<(":
+            depth += 1
+        elif char in ">)":
+            depth -= 1
+        elif char == "," and depth == 0:
+            members.append(type_body[start:index].strip())
+            start = index + 1
+    members.append(type_body[start:].strip())
+    return [member for member in members if member]
+
+def struct_field_paths(path, data_type):
+    """Generate the dotted paths of the fields nested in a type, in declared order.
+
+    Args:
+        path (str): The path of the field with this type, e.g. ``address``
+        data_type (str): GoogleSQL type, e.g. ``STRUCT<city STRING, zip STRING>``
+
+    Yields:
+        str: Nested field paths, each followed by its own nested fields
+    """
+    if data_type.startswith("ARRAY<"):
+        data_type = data_type[len("ARRAY<"):-1]
+    if not data_type.startswith("STRUCT<"):
+        return
+
+    for member in split_type_members(data_type[len("STRUCT<"):-1]):
+        if member.startswith("`"):
+            # Quoted names may contain spaces
+            name, _, member_type = member[1:].partition("`")
+        else:
+            name, _, member_type = member.partition(" ")
+        member_path = f"{path}.{name}"
+        yield member_path
+        yield from struct_field_paths(member_path, member_type.strip())
+
+def get_json_fields(schema_info):
+    """Get the names of the JSON fields worth sampling in a table.
+    
+    Only top-level columns are sampled; JSON fields nested in a STRUCT are
+    listed in the schema but not sampled.
+    
+    Args:
+        schema_info (dict): Table schema information
+        
+    Returns:
+        list: JSON field names, empty if the table has no rows
+    """
+    if not schema_info["num_rows"]:
+        return []
+    return [
+        field["name"] for field in schema_info["fields"]
+        if field["type"] == "JSON" and "." not in field["name"]
+    ]
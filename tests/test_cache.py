@@ -0,0 +1,153 @@
+"""Tests for the on-disk schema cache."""
+
+import json
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+from bq2md import cache
+
+
+def make_schema(name, modified="2024-01-01T00:00:00+00:00", num_rows=10, fields=None):
+    """Build a minimal table schema information dictionary."""
+    return {
+        "name": name,
+        "description": "",
+        "num_rows": num_rows,
+        "created": "",
+        "modified": modified,
+        "fields": fields if fields is not None else [],
+    }
+
+
+def json_field(name, json_schema=None):
+    """Build a JSON field, sampled if a JSON schema is given."""
+    field = {"name": name, "type": "JSON", "mode": "NULLABLE", "description": ""}
+    if json_schema is not None:
+        field["json_schema"] = json_schema
+        field["json_samples"] = [{"sample": name}]
+    return field
+
+
+class CacheFileTest(unittest.TestCase):
+    """Tests for load_cache and save_cache."""
+
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp_dir.cleanup)
+        patcher = mock.patch.object(cache, "CACHE_DIR", Path(self.tmp_dir.name))
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_round_trip(self):
+        schemas = [make_schema("events", fields=[json_field("payload", {"type": "object"})])]
+
+        self.assertTrue(cache.save_cache("project", "dataset", "3:123", schemas))
+
+        self.assertEqual(
+            cache.load_cache("project", "dataset"),
+            {"version": cache.CACHE_FORMAT_VERSION, "fingerprint": "3:123", "schemas": schemas}
+        )
+
+    def test_save_overwrites_previous_entry(self):
+        cache.save_cache("project", "dataset", "1:1", [make_schema("old")])
+        cache.save_cache("project", "dataset", "2:2", [make_schema("new")])
+
+        cached = cache.load_cache("project", "dataset")
+
+        self.assertEqual(cached["fingerprint"], "2:2")
+        self.assertEqual([schema["name"] for schema in cached["schemas"]], ["new"])
+        self.assertEqual(
+            list(cache.get_cache_path("project", "dataset").parent.iterdir()),
+            [cache.get_cache_path("project", "dataset")]
+        )
+
+    def test_missing_file_is_a_miss(self):
+        self.assertIsNone(cache.load_cache("project", "dataset"))
+
+    def test_invalid_json_is_a_miss(self):
+        cache_path = cache.get_cache_path("project", "dataset")
+        cache_path.parent.mkdir(parents=True)
+        cache_path.write_text("{not json", encoding="utf-8")
+
+        self.assertIsNone(cache.load_cache("project", "dataset"))
+
+    def test_malformed_entry_is_a_miss(self):
+        cache_path = cache.get_cache_path("project", "dataset")
+        cache_path.parent.mkdir(parents=True)
+
+        version = cache.CACHE_FORMAT_VERSION
+        for content in (
+            [],
+            {"version": version, "schemas": []},
+            {"version": version, "fingerprint": "1:1"},
+            {"version": version, "fingerprint": "1:1", "schemas": {}},
+            {"version": version, "fingerprint": "1:1", "schemas": [{}]},
+            {"version": version, "fingerprint": "1:1", "schemas": [make_schema("events", num_rows=None)]},
+            {"version": version, "fingerprint": "1:1", "schemas": [make_schema("events", fields=[{"name": "id"}])]},
+        ):
+            with self.subTest(content=content):
+                cache_path.write_text(json.dumps(content), encoding="utf-8")
+                self.assertIsNone(cache.load_cache("project", "dataset"))
+
+    def test_other_format_version_is_a_miss(self):
+        cache_path = cache.get_cache_path("project", "dataset")
+        cache_path.parent.mkdir(parents=True)
+
+        for version in (None, cache.CACHE_FORMAT_VERSION + 1):
+            with self.subTest(version=version):
+                content = {"fingerprint": "1:1", "schemas": [make_schema("events")]}
+                if version is not None:
+                    content["version"] = version
+                cache_path.write_text(json.dumps(content), encoding="utf-8")
+                self.assertIsNone(cache.load_cache("project", "dataset"))
+
+
+class ReuseJsonSamplesTest(unittest.TestCase):
+    """Tests for reuse_json_samples."""
+
+    def test_reuses_unchanged_table(self):
+        schemas = [make_schema("events", fields=[json_field("payload")])]
+        cached = [make_schema("events", fields=[json_field("payload", {"type": "object"})])]
+
+        reused = cache.reuse_json_samples(schemas, cached)
+
+        self.assertEqual(reused, {"events"})
+        self.assertEqual(schemas[0]["fields"][0]["json_schema"], {"type": "object"})
+        self.assertEqual(schemas[0]["fields"][0]["json_samples"], [{"sample": "payload"}])
+
+    def test_skips_modified_table(self):
+        schemas = [make_schema("events", modified="2024-02-01T00:00:00+00:00", fields=[json_field("payload")])]
+        cached = [make_schema("events", fields=[json_field("payload", {"type": "object"})])]
+
+        self.assertEqual(cache.reuse_json_samples(schemas, cached), set())
+        self.assertNotIn("json_schema", schemas[0]["fields"][0])
+
+    def test_skips_table_missing_from_cache(self):
+        schemas = [make_schema("events", fields=[json_field("payload")])]
+
+        self.assertEqual(cache.reuse_json_samples(schemas, [make_schema("other")]), set())
+
+    def test_skips_table_without_modified_time(self):
+        schemas = [make_schema("events", modified="", fields=[json_field("payload")])]
+        cached = [make_schema("events", modified="", fields=[json_field("payload", {"type": "object"})])]
+
+        self.assertEqual(cache.reuse_json_samples(schemas, cached), set())
+
+    def test_skips_table_with_unsampled_json_field(self):
+        schemas = [make_schema("events", fields=[json_field("payload"), json_field("meta")])]
+        cached = [make_schema("events", fields=[json_field("payload", {"type": "object"}), json_field("meta")])]
+
+        self.assertEqual(cache.reuse_json_samples(schemas, cached), set())
+        self.assertNotIn("json_schema", schemas[0]["fields"][0])
+
+    def test_reuses_table_without_json_fields(self):
+        schemas = [make_schema("events")]
+        cached = [make_schema("events")]
+
+        self.assertEqual(cache.reuse_json_samples(schemas, cached), {"events"})
+
+
+if __name__ == "__main__":
+    unittest.main()
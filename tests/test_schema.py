@@ -0,0 +1,110 @@
+"""Tests for the table schema helpers."""
+
+import unittest
+
+from bq2md import schema
+
+
+class ParseDataTypeTest(unittest.TestCase):
+    """Tests for parse_data_type."""
+
+    def test_scalar_types(self):
+        self.assertEqual(schema.parse_data_type("STRING", "YES"), ("STRING", "NULLABLE"))
+        self.assertEqual(schema.parse_data_type("INT64", "NO"), ("INTEGER", "REQUIRED"))
+        self.assertEqual(schema.parse_data_type("BOOL", "YES"), ("BOOLEAN", "NULLABLE"))
+        self.assertEqual(schema.parse_data_type("JSON", "YES"), ("JSON", "NULLABLE"))
+
+    def test_parameterised_types(self):
+        self.assertEqual(schema.parse_data_type("NUMERIC(10, 2)", "YES"), ("NUMERIC", "NULLABLE"))
+        self.assertEqual(schema.parse_data_type("STRING(10)", "NO"), ("STRING", "REQUIRED"))
+
+    def test_struct_type(self):
+        self.assertEqual(
+            schema.parse_data_type("STRUCT<city STRING, zip STRING>", "YES"),
+            ("RECORD", "NULLABLE")
+        )
+
+    def test_array_is_repeated(self):
+        self.assertEqual(schema.parse_data_type("ARRAY<FLOAT64>", "NO"), ("FLOAT", "REPEATED"))
+        self.assertEqual(
+            schema.parse_data_type("ARRAY<STRUCT<a INT64, b ARRAY<STRING>>>", "NO"),
+            ("RECORD", "REPEATED")
+        )
+
+
+class SplitTypeMembersTest(unittest.TestCase):
+    """Tests for split_type_members."""
+
+    def test_splits_on_top_level_commas(self):
+        self.assertEqual(
+            schema.split_type_members("a INT64, b STRING"),
+            ["a INT64", "b STRING"]
+        )
+
+    def test_keeps_nested_and_parameterised_members_whole(self):
+        self.assertEqual(
+            schema.split_type_members("a NUMERIC(10, 2), b STRUCT<c INT64, d ARRAY<STRING>>, e BOOL"),
+            ["a NUMERIC(10, 2)", "b STRUCT<c INT64, d ARRAY<STRING>>", "e BOOL"]
+        )
+
+    def test_empty_body(self):
+        self.assertEqual(schema.split_type_members(""), [])
+
+
+class StructFieldPathsTest(unittest.TestCase):
+    """Tests for struct_field_paths."""
+
+    def test_scalar_type_has_no_nested_fields(self):
+        self.assertEqual(list(schema.struct_field_paths("name", "STRING")), [])
+
+    def test_fields_in_declared_order(self):
+        self.assertEqual(
+            list(schema.struct_field_paths("address", "STRUCT<zip STRING, city STRING, country STRING>")),
+            ["address.zip", "address.city", "address.country"]
+        )
+
+    def test_nested_fields_follow_their_parent(self):
+        data_type = "STRUCT<z STRUCT<y INT64, x NUMERIC(10, 2)>, a ARRAY<STRUCT<c STRING, b STRING>>, m BOOL>"
+
+        self.assertEqual(
+            list(schema.struct_field_paths("s", data_type)),
+            ["s.z", "s.z.y", "s.z.x", "s.a", "s.a.c", "s.a.b", "s.m"]
+        )
+
+    def test_repeated_struct(self):
+        self.assertEqual(
+            list(schema.struct_field_paths("items", "ARRAY<STRUCT<sku STRING, qty INT64>>")),
+            ["items.sku", "items.qty"]
+        )
+
+    def test_backquoted_members(self):
+        self.assertEqual(
+            list(schema.struct_field_paths("s", "STRUCT<`select` STRING, `my field` STRUCT<`from` INT64>>")),
+            ["s.select", "s.my field", "s.my field.from"]
+        )
+
+
+class GetJsonFieldsTest(unittest.TestCase):
+    """Tests for get_json_fields."""
+
+    def test_top_level_json_fields(self):
+        schema_info = {
+            "num_rows": 5,
+            "fields": [
+                {"name": "id", "type": "INTEGER"},
+                {"name": "payload", "type": "JSON"},
+                {"name": "meta", "type": "RECORD"},
+                {"name": "meta.extra", "type": "JSON"},
+            ],
+        }
+
+        self.assertEqual(schema.get_json_fields(schema_info), ["payload"])
+
+    def test_empty_table(self):
+        schema_info = {"num_rows": 0, "fields": [{"name": "payload", "type": "JSON"}]}
+
+        self.assertEqual(schema.get_json_fields(schema_info), [])
+
+
+if __name__ == "__main__":
+    unittest.main()